@@ -1,69 +1,220 @@
 import os
 import requests
-import json
-from datetime import datetime
+from requests.adapters import HTTPAdapter
+import urllib3
+from urllib3.util.retry import Retry
+import orjson
+import gzip
 import random
 import time
-from typing import Any, Dict
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple, Union
 from dotenv import load_dotenv
 
+# httpx and asyncio are only needed by AsyncSwarmsAPIClient and are imported there,
+# keeping them off the start-up path of the synchronous CLI
+if TYPE_CHECKING:
+    import httpx
+
 # Load environment variables from the .env file
 load_dotenv()
 
-class SwarmsAPIClient:
-    def __init__(self, base_url: str = "https://api.swarms.ai/v1", debug: bool = True):
+# Statuses worth retrying; anything else (400, 401, ...) is returned straight away
+RETRYABLE_STATUS_CODES = {429, 502, 503, 504}
+
+# Minimum wait before re-asking for an agent the completions endpoint can't see yet;
+# that lag is eventual consistency, so jitter is added on top rather than replacing it
+AGENT_NOT_FOUND_DELAY = 5.0
+
+# With compress_requests enabled, request bodies larger than this are sent gzip-compressed
+GZIP_MIN_BYTES = 1024
+
+class _SwarmsClientBase:
+    def __init__(self, base_url: str = "https://api.swarms.ai/v1", debug: bool = True, compress_requests: bool = False):
         self.base_url = base_url
-        self.api_key = os.getenv('OPENAI_API_KEY')
-        self.openai_api_key = os.getenv('OPENAI_API_KEY')  # Load OpenAI API key
+        # Endpoint URLs are fixed per client, so build them once
+        self._ep_users = f"{base_url}/users"
+        self._ep_user_keys_tmpl = base_url + "/users/{}/api-keys"
+        self._ep_agent = f"{base_url}/agent"
+        self._ep_completions = f"{base_url}/agent/completions"
+
+        openai_api_key = os.getenv('OPENAI_API_KEY')
+        if not openai_api_key:
+            raise ValueError("OPENAI_API_KEY environment variable is not set.")
+
+        self.openai_api_key = openai_api_key  # Sent with completions
+        self.api_key = openai_api_key  # Bootstrap only; replaced by the Swarms-issued key
         self.user_id = None
         self.debug = debug
-
-        if not self.api_key:
-            raise ValueError("OPENAI_API_KEY environment variable is not set.")
-        if not self.openai_api_key:
-            raise ValueError("OPENAI_API_KEY environment variable is not set.")
+        # Off by default: the server is not known to accept gzip request bodies
+        self.compress_requests = compress_requests
+
+        # Static part of every agent_config sent to the agent endpoint
+        self._agent_template = {
+            "description": "API-created agent",
+            "max_loops": 1,
+            "autosave": True,
+            "dashboard": False,
+            "verbose": True,
+            "dynamic_temperature_enabled": True,
+            "user_name": "default_user",
+            "retry_attempts": 1,
+            "context_length": 200000,
+            "output_type": "string",
+            "streaming_on": False,
+            "tags": ["api_created"]
+        }
+        # Per-client generator for retry usernames and backoff jitter
+        self._rng = random.Random()
+
+    @property
+    def api_key(self):
+        return self._api_key
+
+    @api_key.setter
+    def api_key(self, value):
+        # Stripped once here, and the per-request auth headers are rebuilt only
+        # when the key changes
+        self._api_key = value.strip() if value else None
+        self._auth_headers = {"api-key": self._api_key} if self._api_key else {}
+        self._completion_headers = {**self._auth_headers, "OpenAI-API-Key": self.openai_api_key}
+
+    def _backoff_delay(self, attempt: int, base: float = 1.0, cap: float = 30.0, floor: float = 0.0) -> float:
+        # Truncated exponential backoff with full jitter, on top of an optional floor
+        return floor + self._rng.random() * min(cap, base * (2 ** attempt))
+
+    def _encode_body(self, body: Dict[str, Any]) -> Tuple[bytes, Dict[str, str]]:
+        # Long prompts and system prompts compress well; level 1 keeps the CPU cost low
+        raw = orjson.dumps(body)
+        if self.compress_requests and len(raw) > GZIP_MIN_BYTES:
+            return gzip.compress(raw, compresslevel=1), {"Content-Encoding": "gzip"}
+        return raw, {}
 
     def _debug_print(self, message: str, data: Any = None):
         if self.debug:
             print(f"\nDEBUG: {message}")
             if data is not None:
-                print(json.dumps(data, indent=2) if isinstance(data, (dict, list)) else str(data))
+                print(orjson.dumps(data, option=orjson.OPT_INDENT_2).decode() if isinstance(data, (dict, list)) else str(data))
 
-    def _handle_response(self, response: requests.Response, operation: str) -> Dict[str, Any]:
-        self._debug_print(f"Response Status Code: {response.status_code}")
-        self._debug_print("Response Headers:", dict(response.headers))
-        self._debug_print("Raw Response Text:", response.text)
+    def _handle_response(self, response: Union[requests.Response, "httpx.Response"], operation: str) -> Dict[str, Any]:
+        # Work from the raw bytes only; response.text would decode (and charset-sniff)
+        # the whole body a second time
+        content = response.content
 
-        try:
-            if response.status_code == 204:
-                return {}
+        # Headers and body text are only materialised when debugging, so the
+        # common success case is just a status check and one parse
+        if self.debug:
+            self._debug_print(f"Response Status Code: {response.status_code}")
+            self._debug_print("Response Headers:", dict(response.headers))
+            self._debug_print("Raw Response Text:", content.decode("utf-8", "replace"))
+
+        if response.status_code == 204:
+            return {}
 
-            if not response.content:
-                raise Exception(f"Empty response received from {operation}")
+        if not content:
+            raise Exception(f"Empty response received from {operation}")
 
-            result = response.json()
+        try:
+            result = orjson.loads(content)
+        except orjson.JSONDecodeError as e:
+            raise Exception(f"Invalid JSON response from {operation}: {str(e)}\nRaw response: {content.decode('utf-8', 'replace')}")
+
+        if self.debug:
             self._debug_print("Parsed JSON Response:", result)
-            return result
-        except json.JSONDecodeError as e:
-            raise Exception(f"Invalid JSON response from {operation}: {str(e)}\nRaw response: {response.text}")
-        except requests.exceptions.RequestException as e:
-            raise Exception(f"Request failed during {operation}: {str(e)}")
+        return result
 
-    def create_user(self, username: str) -> Dict[str, Any]:
-        endpoint = f"{self.base_url}/users"
-        headers = {
+class SwarmsAPIClient(_SwarmsClientBase):
+    def __init__(self, base_url: str = "https://api.swarms.ai/v1", debug: bool = True, compress_requests: bool = False):
+        super().__init__(base_url, debug, compress_requests)
+
+        # Persistent session so every call reuses the same keep-alive connection
+        self.session = requests.Session()
+        self.session.headers.update({
             "Content-Type": "application/json",
             "Accept": "application/json"
-        }
+        })
+        # Connection errors and RETRYABLE_STATUS_CODES are retried by urllib3 itself,
+        # with exponential backoff and honouring Retry-After
+        self._retry = Retry(
+            total=3,
+            backoff_factor=1.0,
+            status_forcelist=RETRYABLE_STATUS_CODES,
+            allowed_methods=["POST"],
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        self._pool_maxsize = 20
+        self._mount_adapter()
+
+        # Serialises API key rotation when parallel create_agent calls all see a 401
+        self._rotation_lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        self.session.close()
+
+    def _sleep_backoff(self, attempt: int, floor: float = 0.0):
+        time.sleep(self._backoff_delay(attempt, floor=floor))
+
+    def warm_up(self, timeout: float = 2.0) -> threading.Thread:
+        # Opt-in: complete the TCP + TLS handshake in the background so a pooled
+        # connection is ready once the caller's own setup work is done. Only pays
+        # off if there is such work; a request started right away opens its own.
+        def _head():
+            # Resolve the connection exactly as the session's adapter would (same TLS
+            # context, verify and proxy settings), so the warmed socket lands in the
+            # pool later requests draw from. Retries are off: a down host costs one
+            # connect attempt rather than the session's Retry schedule.
+            request = self.session.prepare_request(requests.Request("HEAD", self.base_url))
+            settings = self.session.merge_environment_settings(request.url, {}, None, None, None)
+            adapter = self.session.get_adapter(request.url)
+            try:
+                conn = adapter.get_connection_with_tls_context(
+                    request, settings["verify"], proxies=settings["proxies"], cert=settings["cert"]
+                )
+                conn.urlopen(
+                    "HEAD",
+                    adapter.request_url(request, settings["proxies"]),
+                    headers=request.headers,
+                    retries=False,
+                    timeout=timeout
+                )
+            except (urllib3.exceptions.HTTPError, requests.exceptions.RequestException):
+                pass  # Best effort; the first real request will connect anyway
+
+        thread = threading.Thread(target=_head, daemon=True)
+        thread.start()
+        return thread
+
+    def _mount_adapter(self):
+        old_adapter = self.session.adapters.get("https://")
+        self.session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=self._pool_maxsize, max_retries=self._retry))
+        # Release the replaced adapter's pooled sockets instead of leaving them to GC
+        if old_adapter is not None:
+            old_adapter.close()
+
+    def _ensure_pool_size(self, max_workers: int):
+        # Every worker thread should get its own pooled keep-alive connection
+        if max_workers > self._pool_maxsize:
+            self._pool_maxsize = max_workers
+            self._mount_adapter()
 
+    def create_user(self, username: str) -> Dict[str, Any]:
+        endpoint = self._ep_users
         body = {"username": username}
 
-        self._debug_print("Creating user with endpoint:", endpoint)
-        self._debug_print("Request Headers:", headers)
-        self._debug_print("Request Body:", body)
+        if self.debug:
+            self._debug_print("Creating user with endpoint:", endpoint)
+            self._debug_print("Request Body:", body)
 
         try:
-            response = requests.post(endpoint, headers=headers, json=body)
+            response = self.session.post(endpoint, data=orjson.dumps(body))
             result = self._handle_response(response, "User creation")
 
             self.api_key = result.get('api_key')
@@ -75,23 +226,17 @@ class SwarmsAPIClient:
             raise Exception(f"Failed to create user: {str(e)}")
 
     def create_api_key(self, user_id: str) -> Dict[str, Any]:
-        endpoint = f"{self.base_url}/users/{user_id}/api-keys"
-        headers = {
-            "api-key": self.api_key,
-            "Content-Type": "application/json",
-            "Accept": "application/json"
-        }
-
+        endpoint = self._ep_user_keys_tmpl.format(user_id)
         body = {"name": "new_api_key"}
 
-        self._debug_print("Creating API key with endpoint:", endpoint)
-        self._debug_print("Request Headers:", headers)
-        self._debug_print("Request Body:", body)
+        if self.debug:
+            self._debug_print("Creating API key with endpoint:", endpoint)
+            self._debug_print("Request Headers:", self._auth_headers)
+            self._debug_print("Request Body:", body)
 
         try:
-            response = requests.post(endpoint, headers=headers, json=body)
-            result = self._handle_response(response, "API key creation")
-            return result
+            response = self.session.post(endpoint, headers=self._auth_headers, data=orjson.dumps(body))
+            return self._handle_response(response, "API key creation")
         except Exception as e:
             self._debug_print("Error in create_api_key:", str(e))
             raise Exception(f"Failed to create API key: {str(e)}")
@@ -101,101 +246,298 @@ class SwarmsAPIClient:
                       system_prompt: str = "You are a helpful AI assistant.",
                       model_name: str = "gpt-4",
                       temperature: float = 0.7) -> Dict[str, Any]:
+        # Only the per-agent fields change; the template and the payload are
+        # built once rather than on every retry
+        agent_config = {
+            **self._agent_template,
+            "agent_name": agent_name,
+            "model_name": model_name,
+            "system_prompt": system_prompt,
+            "temperature": temperature
+        }
+        payload, encoding_headers = self._encode_body(agent_config)
+
         max_attempts = 3
         for attempt in range(max_attempts):
             if not self.api_key:
                 raise Exception("No API key available. Create a user first.")
 
-            endpoint = f"{self.base_url}/agent"
-            headers = {
-                "api-key": self.api_key.strip(),
+            endpoint = self._ep_agent
+            headers = self._auth_headers
+            request_key = headers.get("api-key")
+            if encoding_headers:
+                headers = {**headers, **encoding_headers}
+
+            if self.debug:
+                self._debug_print("Creating agent with endpoint:", endpoint)
+                self._debug_print("Request Headers:", headers)
+                self._debug_print("Request Body:", agent_config)
+
+            # Transient failures are retried by the session adapter; this loop
+            # only handles rotating an invalid API key
+            response = self.session.post(endpoint, headers=headers, data=payload)
+            result = self._handle_response(response, "Agent creation")
+            if 'agent_id' not in result:
+                if response.status_code == 401:
+                    if attempt < max_attempts - 1:
+                        self._rotate_api_key(request_key)
+                        continue  # Retry with new API key
+                    else:
+                        raise Exception("API Key remains invalid after multiple attempts.")
+                else:
+                    raise Exception("Agent creation failed; no agent_id in response.")
+            return result
+
+    def _rotate_api_key(self, failed_key: str):
+        # Only the first worker to see a 401 for this key creates a new user;
+        # the others find the key already replaced and just retry with it
+        with self._rotation_lock:
+            if self._api_key == failed_key:
+                print("API Key is invalid or expired. Creating a new user...")
+                # Generate a new username for the new user
+                new_username = f"user_{self._rng.randint(1000, 9999)}"
+                self.create_user(new_username)
+
+    def create_agents(self, configs: List[Dict[str, Any]], max_workers: int = 10) -> List[Dict[str, Any]]:
+        # Each config holds create_agent keyword arguments; results keep the order of `configs`
+        self._ensure_pool_size(max_workers)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(lambda config: self.create_agent(**config), configs))
+
+    def generate_completion(self, api_key: str, agent_id: str, prompt: str, max_retries: int = 3) -> Dict[str, Any]:
+        if not self.api_key:
+            raise Exception("No API key available. Ensure a user is created.")
+
+        endpoint = self._ep_completions
+        if api_key == self.api_key:
+            headers = self._completion_headers
+        else:
+            headers = {"api-key": api_key.strip(), "OpenAI-API-Key": self.openai_api_key}
+        body = {
+            "prompt": prompt,
+            "agent_id": agent_id
+        }
+
+        payload, encoding_headers = self._encode_body(body)
+        if encoding_headers:
+            headers = {**headers, **encoding_headers}
+
+        if self.debug:
+            self._debug_print("Generating completion with endpoint:", endpoint)
+            self._debug_print("Request Headers:", headers)
+            self._debug_print("Request Body:", body)
+
+        # Transient failures are retried by the session adapter; this loop only
+        # waits out an agent that is not visible to the completions endpoint yet
+        for attempt in range(max_retries):
+            response = self.session.post(endpoint, headers=headers, data=payload)
+            result = self._handle_response(response, "Completion generation")
+
+            # Check if the agent wasn't found
+            if result.get('detail', '').startswith('Error processing completion: 404'):
+                if attempt < max_retries - 1:  # Don't print this on the last attempt
+                    print("Agent not found. Retrying...")
+                    self._sleep_backoff(attempt, floor=AGENT_NOT_FOUND_DELAY)
+                else:
+                    raise Exception(f"Agent {agent_id} still not found after retries.")
+            else:
+                return result
+
+    def generate_completions(self, api_key: str, agent_id: str, prompts: List[str], max_workers: int = 10) -> List[Dict[str, Any]]:
+        # Bounded worker pool over the shared session; results keep the order of `prompts`
+        self._ensure_pool_size(max_workers)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(lambda prompt: self.generate_completion(api_key, agent_id, prompt), prompts))
+
+class AsyncSwarmsAPIClient(_SwarmsClientBase):
+    def __init__(self, base_url: str = "https://api.swarms.ai/v1", debug: bool = True, compress_requests: bool = False):
+        super().__init__(base_url, debug, compress_requests)
+        import asyncio
+        import httpx
+
+        self._asyncio = asyncio
+        # Serialises API key rotation when concurrent create_agent calls all see a 401
+        self._rotation_lock = asyncio.Lock()
+
+        self._transport_errors = (httpx.TransportError,)
+
+        # One pooled HTTP/2 client so concurrent completions multiplex over a
+        # single connection (needs `pip install 'httpx[http2]'`)
+        self.client = httpx.AsyncClient(
+            base_url=base_url,
+            http2=True,
+            headers={
                 "Content-Type": "application/json",
                 "Accept": "application/json"
-            }
+            },
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20)
+        )
 
-            agent_config = {
-                "agent_name": agent_name,
-                "model_name": model_name,
-                "description": "API-created agent",
-                "system_prompt": system_prompt,
-                "temperature": temperature,
-                "max_loops": 1,
-                "autosave": True,
-                "dashboard": False,
-                "verbose": True,
-                "dynamic_temperature_enabled": True,
-                "user_name": "default_user",
-                "retry_attempts": 1,
-                "context_length": 200000,
-                "output_type": "string",
-                "streaming_on": False,
-                "tags": ["api_created"]
-            }
+    async def __aenter__(self):
+        return self
 
-            self._debug_print("Creating agent with endpoint:", endpoint)
-            self._debug_print("Request Headers:", headers)
-            self._debug_print("Request Body:", agent_config)
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
+
+    async def aclose(self):
+        await self.client.aclose()
+
+    async def _sleep_backoff(self, attempt: int, floor: float = 0.0):
+        await self._asyncio.sleep(self._backoff_delay(attempt, floor=floor))
+
+    async def create_user(self, username: str) -> Dict[str, Any]:
+        body = {"username": username}
+
+        if self.debug:
+            self._debug_print("Creating user with endpoint:", self._ep_users)
+            self._debug_print("Request Body:", body)
+
+        try:
+            response = await self.client.post(self._ep_users, content=orjson.dumps(body))
+            result = self._handle_response(response, "User creation")
+
+            self.api_key = result.get('api_key')
+            self.user_id = result.get('user_id')
+
+            return result
+        except Exception as e:
+            self._debug_print("Error in create_user:", str(e))
+            raise Exception(f"Failed to create user: {str(e)}")
+
+    async def create_api_key(self, user_id: str) -> Dict[str, Any]:
+        endpoint = self._ep_user_keys_tmpl.format(user_id)
+        headers = self._auth_headers
+        body = {"name": "new_api_key"}
+
+        if self.debug:
+            self._debug_print("Creating API key with endpoint:", endpoint)
+            self._debug_print("Request Body:", body)
+
+        try:
+            response = await self.client.post(endpoint, headers=headers, content=orjson.dumps(body))
+            return self._handle_response(response, "API key creation")
+        except Exception as e:
+            self._debug_print("Error in create_api_key:", str(e))
+            raise Exception(f"Failed to create API key: {str(e)}")
+
+    async def create_agent(self,
+                           agent_name: str,
+                           system_prompt: str = "You are a helpful AI assistant.",
+                           model_name: str = "gpt-4",
+                           temperature: float = 0.7) -> Dict[str, Any]:
+        agent_config = {
+            **self._agent_template,
+            "agent_name": agent_name,
+            "model_name": model_name,
+            "system_prompt": system_prompt,
+            "temperature": temperature
+        }
+        payload, encoding_headers = self._encode_body(agent_config)
+
+        max_attempts = 3
+        for attempt in range(max_attempts):
+            if not self.api_key:
+                raise Exception("No API key available. Create a user first.")
+
+            headers = self._auth_headers
+            request_key = headers.get("api-key")
+            if encoding_headers:
+                headers = {**headers, **encoding_headers}
+
+            if self.debug:
+                self._debug_print("Creating agent with endpoint:", self._ep_agent)
+                self._debug_print("Request Body:", agent_config)
 
             try:
-                response = requests.post(endpoint, headers=headers, json=agent_config)
-                result = self._handle_response(response, "Agent creation")
-                if 'agent_id' not in result:
-                    if response.status_code == 401:
-                        if attempt < max_attempts - 1:
-                            print("API Key is invalid or expired. Creating a new user...")
-                            # Generate a new username for the new user
-                            new_username = f"user_{random.randint(1000, 9999)}"
-                            self.create_user(new_username)
-                            continue  # Retry with new API key
-                        else:
-                            raise Exception("API Key remains invalid after multiple attempts.")
-                    else:
-                        raise Exception("Agent creation failed; no agent_id in response.")
-                return result
-            except Exception as e:
+                response = await self.client.post(self._ep_agent, headers=headers, content=payload)
+            except self._transport_errors as e:
                 self._debug_print(f"Error in create_agent, attempt {attempt + 1}:", str(e))
                 if attempt == max_attempts - 1:  # If it's the last attempt, raise the error
                     raise
+                await self._sleep_backoff(attempt)
+                continue
+
+            # Transient server-side failures are retried with backoff
+            if response.status_code in RETRYABLE_STATUS_CODES and attempt < max_attempts - 1:
+                print(f"Agent creation returned {response.status_code}. Retrying...")
+                await self._sleep_backoff(attempt)
+                continue
+
+            result = self._handle_response(response, "Agent creation")
+            if 'agent_id' not in result:
+                if response.status_code == 401:
+                    if attempt < max_attempts - 1:
+                        await self._rotate_api_key(request_key)
+                        continue  # Retry with new API key
+                    else:
+                        raise Exception("API Key remains invalid after multiple attempts.")
+                else:
+                    raise Exception("Agent creation failed; no agent_id in response.")
+            return result
 
-    def generate_completion(self, api_key: str, agent_id: str, prompt: str, max_retries: int = 3) -> Dict[str, Any]:
+    async def _rotate_api_key(self, failed_key: str):
+        # Only the first task to see a 401 for this key creates a new user;
+        # the others find the key already replaced and just retry with it
+        async with self._rotation_lock:
+            if self._api_key == failed_key:
+                print("API Key is invalid or expired. Creating a new user...")
+                # Generate a new username for the new user
+                new_username = f"user_{self._rng.randint(1000, 9999)}"
+                await self.create_user(new_username)
+
+    async def generate_completion(self, api_key: str, agent_id: str, prompt: str, max_retries: int = 3) -> Dict[str, Any]:
         if not self.api_key:
             raise Exception("No API key available. Ensure a user is created.")
 
-        endpoint = f"{self.base_url}/agent/completions"
-        headers = {
-            "api-key": api_key.strip(),
-            "Content-Type": "application/json",
-            "Accept": "application/json",
-            "OpenAI-API-Key": self.openai_api_key  # Include OpenAI API key
-        }
+        if api_key == self.api_key:
+            headers = self._completion_headers
+        else:
+            headers = {"api-key": api_key.strip(), "OpenAI-API-Key": self.openai_api_key}
         body = {
             "prompt": prompt,
             "agent_id": agent_id
         }
+        payload, encoding_headers = self._encode_body(body)
+        if encoding_headers:
+            headers = {**headers, **encoding_headers}
 
-        self._debug_print("Generating completion with endpoint:", endpoint)
-        self._debug_print("Request Headers:", headers)
-        self._debug_print("Request Body:", body)
+        if self.debug:
+            self._debug_print("Generating completion with endpoint:", self._ep_completions)
+            self._debug_print("Request Body:", body)
 
         for attempt in range(max_retries):
             try:
-                response = requests.post(endpoint, headers=headers, json=body)
-                result = self._handle_response(response, "Completion generation")
-
-                # Check if the agent wasn't found
-                if result.get('detail', '').startswith('Error processing completion: 404'):
-                    if attempt < max_retries - 1:  # Don't print this on the last attempt
-                        print(f"Agent not found. Retrying in {5} seconds...")
-                        time.sleep(5)  # Fixed delay
-                    else:
-                        raise Exception(f"Agent {agent_id} still not found after retries.")
-                else:
-                    return result
-            except Exception as e:
+                response = await self.client.post(self._ep_completions, headers=headers, content=payload)
+            except self._transport_errors as e:
                 if attempt == max_retries - 1:  # If this was the last attempt
                     raise
-                print(f"Attempt {attempt + 1} failed. Retrying in {5} seconds...")
-                time.sleep(5)  # Fixed delay
+                print(f"Attempt {attempt + 1} failed: {str(e)}. Retrying...")
+                await self._sleep_backoff(attempt)
+                continue
+
+            # Transient server-side failures are retried with backoff
+            if response.status_code in RETRYABLE_STATUS_CODES and attempt < max_retries - 1:
+                print(f"Completion generation returned {response.status_code}. Retrying...")
+                await self._sleep_backoff(attempt)
+                continue
+
+            result = self._handle_response(response, "Completion generation")
+
+            # Check if the agent wasn't found
+            if result.get('detail', '').startswith('Error processing completion: 404'):
+                if attempt < max_retries - 1:  # Don't print this on the last attempt
+                    print("Agent not found. Retrying...")
+                    await self._sleep_backoff(attempt, floor=AGENT_NOT_FOUND_DELAY)
+                else:
+                    raise Exception(f"Agent {agent_id} still not found after retries.")
+            else:
+                return result
+
+    async def generate_completions_batch(self, api_key: str, agent_id: str, prompts: List[str]) -> List[Dict[str, Any]]:
+        # Overlap the round trips instead of awaiting each prompt in turn
+        return await self._asyncio.gather(*[
+            self.generate_completion(api_key, agent_id, prompt) for prompt in prompts
+        ])
 
 def main():
     client = SwarmsAPIClient(debug=True)
@@ -276,13 +618,15 @@ def main():
                 }
 
             # Write to JSON file
-            with open('swarms_api_results.json', 'w') as f:
-                json.dump(result_json, f, indent=2)
+            with open('swarms_api_results.json', 'wb') as f:
+                f.write(orjson.dumps(result_json, option=orjson.OPT_INDENT_2))
 
             print(f"\nAll results saved to 'swarms_api_results.json'")
 
     except Exception as e:
         print(f"\nError occurred: {str(e)}")
+    finally:
+        client.close()
 
 if __name__ == "__main__":
     main()